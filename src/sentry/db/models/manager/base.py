@@ -109,8 +109,12 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         """
         Given the cache is configured, connects the required signals for invalidation.
         """
-        post_save.connect(self.post_save, sender=sender, weak=False)
-        post_delete.connect(self.post_delete, sender=sender, weak=False)
+        # Only connect hooks that have been overridden, as any delete receiver
+        # prevents Django from fast deleting rows of the model.
+        if type(self).post_save is not BaseManager.post_save:
+            post_save.connect(self.post_save, sender=sender, weak=False)
+        if type(self).post_delete is not BaseManager.post_delete:
+            post_delete.connect(self.post_delete, sender=sender, weak=False)
 
         if not self.cache_fields:
             return
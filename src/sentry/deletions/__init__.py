@@ -33,9 +33,10 @@ Deletion Tasks
 
 The deletions system provides two base classes to cover common scenarios:
 
-- ``ModelDeletionTask`` fetches records and deletes each instance individually. This strategy is
-  good for models that rely on django signals or have child relations. This strategy is also the
-  default used when a deletion task isn't specified for a model.
+- ``ModelDeletionTask`` fetches records and deletes them a batch at a time through the Django
+  collector, or each instance individually when the task or model customize deletion. This
+  strategy is good for models that rely on django signals or have child relations. This strategy
+  is also the default used when a deletion task isn't specified for a model.
 - ``BulkModelDeletionTask`` Deletes records in bulk using a single query. This strategy is well
   suited to removing records that don't have any relations.
 
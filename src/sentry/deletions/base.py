@@ -1,6 +1,9 @@
 import logging
 import re
 
+from django.db import models
+from django.db.models.deletion import Collector
+
 from sentry.constants import ObjectStatus
 from sentry.utils import metrics
 from sentry.utils.query import bulk_delete_objects
@@ -210,8 +213,42 @@ class ModelDeletionTask(BaseDeletionTask):
         # We have more work to do as we didn't run out of rows to delete.
         return True
 
+    def can_delete_queryset(self):
+        """
+        Returns ``True`` if a batch can be removed with a queryset delete rather
+        than one ``delete()`` call per instance. This is only the case when
+        neither the task nor the model customize deletion.
+        """
+        if type(self).delete_instance is not ModelDeletionTask.delete_instance:
+            return False
+        return self.model.delete is models.Model.delete
+
+    def can_fast_delete(self, queryset):
+        """
+        Returns ``True`` if the rows of ``queryset`` can be removed with a single
+        query, skipping the Django collector. On top of ``can_delete_queryset``
+        this requires the model to have no delete signal receivers or relations
+        that have to be cascaded.
+        """
+        if not self.can_delete_queryset():
+            return False
+        return Collector(using=queryset.db).can_fast_delete(queryset)
+
     def delete_instance_bulk(self, instance_list):
-        # slow, but ensures Django cascades are handled
+        queryset = self.model._base_manager.filter(id__in=[i.id for i in instance_list])
+        if self.can_delete_queryset():
+            if self.can_fast_delete(queryset):
+                queryset._raw_delete(queryset.db)
+            else:
+                # One collector pass cascades the whole batch with a query
+                # per relation, and still sends signals for every row.
+                queryset.delete()
+            # The batch is deleted atomically, so only log once it succeeded.
+            for instance in instance_list:
+                self.log_instance_deletion(instance.id, instance)
+            return
+
+        # slow, but ensures custom deletion logic is run
         for instance in instance_list:
             self.delete_instance(instance)
 
@@ -220,18 +257,21 @@ class ModelDeletionTask(BaseDeletionTask):
         try:
             instance.delete()
         finally:
-            # Don't log Group and Event child object deletions.
-            model_name = type(instance).__name__
-            if not _leaf_re.search(model_name):
-                self.logger.info(
-                    "object.delete.executed",
-                    extra={
-                        "object_id": instance_id,
-                        "transaction_id": self.transaction_id,
-                        "app_label": instance._meta.app_label,
-                        "model": model_name,
-                    },
-                )
+            self.log_instance_deletion(instance_id, instance)
+
+    def log_instance_deletion(self, instance_id, instance):
+        # Don't log Group and Event child object deletions.
+        model_name = type(instance).__name__
+        if not _leaf_re.search(model_name):
+            self.logger.info(
+                "object.delete.executed",
+                extra={
+                    "object_id": instance_id,
+                    "transaction_id": self.transaction_id,
+                    "app_label": instance._meta.app_label,
+                    "model": model_name,
+                },
+            )
 
     def get_actor(self):
         from sentry.models import User
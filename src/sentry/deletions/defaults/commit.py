@@ -1,12 +1,14 @@
-from ..base import ModelDeletionTask, ModelRelation
+from ..base import BulkModelDeletionTask, ModelDeletionTask, ModelRelation
 
 
 class CommitDeletionTask(ModelDeletionTask):
-    def get_child_relations(self, instance):
+    def get_child_relations_bulk(self, instance_list):
         from sentry.models import CommitFileChange, ReleaseCommit, ReleaseHeadCommit
 
+        # List values are only understood by BulkModelDeletionTask.
+        commit_ids = [i.id for i in instance_list]
+        model_list = (CommitFileChange, ReleaseCommit, ReleaseHeadCommit)
         return [
-            ModelRelation(CommitFileChange, {"commit_id": instance.id}),
-            ModelRelation(ReleaseCommit, {"commit_id": instance.id}),
-            ModelRelation(ReleaseHeadCommit, {"commit_id": instance.id}),
+            ModelRelation(m, {"commit_id": commit_ids}, BulkModelDeletionTask)
+            for m in model_list
         ]
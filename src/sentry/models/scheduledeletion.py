@@ -38,17 +38,21 @@ class ScheduledDeletion(Model):
         db_table = "sentry_scheduleddeletion"
 
     @classmethod
-    def schedule(cls, instance, days=30, hours=0, data=None, actor=None):
+    def schedule(cls, instance, days=30, hours=0, data=None, actor=None, in_progress=False):
         model_name = type(instance).__name__
+        values = {
+            "date_scheduled": timezone.now() + timedelta(days=days, hours=hours),
+            "data": data or {},
+            "actor_id": actor.id if actor else None,
+        }
+        # Only ever set the flag, rescheduling must not reset a running deletion.
+        if in_progress:
+            values["in_progress"] = True
         record, created = cls.objects.create_or_update(
             app_label=instance._meta.app_label,
             model_name=model_name,
             object_id=instance.pk,
-            values={
-                "date_scheduled": timezone.now() + timedelta(days=days, hours=hours),
-                "data": data or {},
-                "actor_id": actor.id if actor else None,
-            },
+            values=values,
         )
         if not created:
             record = cls.objects.get(
@@ -14,6 +14,7 @@ logger = logging.getLogger("sentry.deletions.api")
 
 
 MAX_RETRIES = 5
+SCHEDULED_DELETION_BATCH_SIZE = 100
 
 
 @instrumented_task(
@@ -37,11 +38,13 @@ def reattempt_deletions():
 )
 def run_scheduled_deletions():
     from sentry.models import ScheduledDeletion
+    from sentry.utils.query import RangeQuerySetWrapper
 
     queryset = ScheduledDeletion.objects.filter(
         in_progress=False, date_scheduled__lte=timezone.now()
     )
-    for item in queryset:
+    # Walk the backlog by primary key so only one batch is held in memory.
+    for item in RangeQuerySetWrapper(queryset, step=SCHEDULED_DELETION_BATCH_SIZE):
         with transaction.atomic():
             affected = ScheduledDeletion.objects.filter(
                 id=item.id,
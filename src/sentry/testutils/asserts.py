@@ -37,3 +37,19 @@ def assert_status_code(response, minimum: int, maximum: Optional[int] = None):
     # Omit max to assert status_code == minimum.
     maximum = maximum or minimum + 1
     assert minimum <= response.status_code < maximum, (response.status_code, response.content)
+
+
+def assert_rows_deleted(rows_by_model):
+    """
+    Asserts that none of the given rows exist anymore, issuing a single query
+    per model.
+
+    >>> assert_rows_deleted({Organization: [org.id], Commit: [commit.id, commit2.id]})
+    """
+    remaining = {}
+    for model, ids in rows_by_model.items():
+        found = list(model._base_manager.filter(pk__in=ids).values_list("pk", flat=True))
+        if found:
+            remaining[model.__name__] = found
+
+    assert not remaining, f"Rows were not deleted: {remaining}"
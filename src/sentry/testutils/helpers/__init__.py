@@ -4,6 +4,7 @@ from .features import *  # NOQA
 from .link_header import *  # NOQA
 from .options import *  # NOQA
 from .query import *  # NOQA
+from .signals import *  # NOQA
 from .slack import *  # NOQA
 from .socket import *  # NOQA
 from .task_runner import *  # NOQA
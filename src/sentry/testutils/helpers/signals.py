@@ -0,0 +1,25 @@
+__all__ = ("mute_signals",)
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def mute_signals(*signals):
+    """
+    A context manager that disconnects every receiver of the given signals,
+    e.g. to create fixtures without running their side effects. Receivers
+    connected while muted are dropped when the original ones are restored.
+
+    >>> with mute_signals(post_save):
+    >>>     # ...
+    """
+    muted = [(signal, signal.receivers) for signal in signals]
+    for signal in signals:
+        signal.receivers = []
+        signal.sender_receivers_cache.clear()
+    try:
+        yield
+    finally:
+        for signal, receivers in muted:
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
@@ -1,12 +1,16 @@
 import re
 
 import progressbar
-from django.db import connections, router
+from django.db import connections, router, transaction
 
 from sentry import eventstore
 
 _leaf_re = re.compile(r"^(UserReport|Event|Group)(.+)")
 
+# Bulk deletes that removed more rows than this commit without waiting for
+# their WAL to be flushed.
+ASYNC_COMMIT_DELETE_THRESHOLD = 100
+
 
 class InvalidQuerySetError(ValueError):
     pass
@@ -209,7 +213,14 @@ class WithProgressBar:
 def bulk_delete_objects(
     model, limit=10000, transaction_id=None, logger=None, partition_key=None, **filters
 ):
+    """
+    Deletes up to ``limit`` rows of ``model`` matching ``filters`` with a single
+    query, returning ``True`` if any rows were deleted. A list or tuple value
+    matches any of its items. This is not valid ORM lookup syntax, so relations
+    using it must be pinned to ``BulkModelDeletionTask``.
+    """
     connection = connections[router.db_for_write(model)]
+    outer_atomic = connection.in_atomic_block
     quote_name = connection.ops.quote_name
 
     query = []
@@ -222,8 +233,12 @@ def bulk_delete_objects(
             params.append(value)
 
     for column, value in filters.items():
-        query.append(f"{quote_name(column)} = %s")
-        params.append(value)
+        if isinstance(value, (list, tuple)):
+            query.append(f"{quote_name(column)} = any(%s)")
+            params.append(list(value))
+        else:
+            query.append(f"{quote_name(column)} = %s")
+            params.append(value)
 
     query = """
         delete from %(table)s
@@ -240,10 +255,20 @@ def bulk_delete_objects(
         limit=limit,
     )
 
-    cursor = connection.cursor()
-    cursor.execute(query, params)
-
-    has_more = cursor.rowcount > 0
+    # Without a savepoint this is a no-op inside a caller's transaction.
+    with transaction.atomic(using=connection.alias, savepoint=False):
+        cursor = connection.cursor()
+        cursor.execute(query, params)
+        rowcount = cursor.rowcount
+        # synchronous_commit is only read at commit time, so it can be decided
+        # on the number of deleted rows. Only change the commit mode of
+        # transactions we own. Losing a deletion on a server crash is harmless
+        # as the rows are removed again by the next attempt, and any later
+        # synchronous commit flushes it anyway.
+        if rowcount > ASYNC_COMMIT_DELETE_THRESHOLD and not outer_atomic:
+            cursor.execute("SET LOCAL synchronous_commit TO OFF")
+
+    has_more = rowcount > 0
 
     if has_more and logger is not None and _leaf_re.search(model.__name__) is None:
         logger.info(
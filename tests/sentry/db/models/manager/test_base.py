@@ -0,0 +1,20 @@
+from unittest import TestCase
+
+from django.db.models.deletion import Collector
+from django.db.models.signals import post_delete, post_save
+
+from sentry.models import OrganizationOption, UserReport
+
+
+class BaseManagerSignalsTest(TestCase):
+    def test_no_op_hooks_not_connected(self):
+        # UserReport uses a plain BaseManager without cache fields.
+        assert not post_save.has_listeners(UserReport)
+        assert not post_delete.has_listeners(UserReport)
+        assert Collector(using="default").can_fast_delete(UserReport.objects.all())
+
+    def test_overridden_hooks_connected(self):
+        # OrganizationOptionManager overrides both hooks to invalidate its cache.
+        assert post_save.has_listeners(OrganizationOption)
+        assert post_delete.has_listeners(OrganizationOption)
+        assert not Collector(using="default").can_fast_delete(OrganizationOption.objects.all())
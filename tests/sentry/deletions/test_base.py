@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, pre_delete
+
+from sentry import deletions
+from sentry.models import Dashboard, DashboardWidget, DashboardWidgetQuery, DashboardWidgetTypes
+from sentry.testutils import TestCase
+
+
+class ModelDeletionTaskTest(TestCase):
+    def create_dashboard(self, title):
+        dashboard = Dashboard.objects.create(
+            organization_id=self.organization.id, title=title, created_by=self.user
+        )
+        widget = DashboardWidget.objects.create(
+            dashboard=dashboard,
+            order=0,
+            title="Widget",
+            display_type=0,
+            widget_type=DashboardWidgetTypes.DISCOVER,
+        )
+        query = DashboardWidgetQuery.objects.create(widget=widget, order=0, name="Query")
+        return dashboard, widget, query
+
+    def test_batch_with_cascades_and_signals(self):
+        fixtures = [self.create_dashboard(f"Dashboard {i}") for i in range(3)]
+        other_dashboard, _, _ = self.create_dashboard("Other")
+        other_dashboard.update(organization_id=self.create_organization().id)
+
+        pre_deleted = []
+        post_deleted = []
+
+        def pre_delete_handler(instance, **kwargs):
+            pre_deleted.append(instance.id)
+
+        def post_delete_handler(instance, **kwargs):
+            post_deleted.append((type(instance).__name__, instance.id))
+
+        pre_delete.connect(pre_delete_handler, sender=Dashboard)
+        post_delete.connect(post_delete_handler, sender=DashboardWidget)
+        post_delete.connect(post_delete_handler, sender=DashboardWidgetQuery)
+        self.addCleanup(pre_delete.disconnect, pre_delete_handler, sender=Dashboard)
+        self.addCleanup(post_delete.disconnect, post_delete_handler, sender=DashboardWidget)
+        self.addCleanup(post_delete.disconnect, post_delete_handler, sender=DashboardWidgetQuery)
+
+        task = deletions.get(model=Dashboard, query={"organization_id": self.organization.id})
+        while task.chunk():
+            pass
+
+        dashboard_ids = [dashboard.id for dashboard, _, _ in fixtures]
+        widget_ids = [widget.id for _, widget, _ in fixtures]
+        query_ids = [query.id for _, _, query in fixtures]
+        assert not Dashboard.objects.filter(id__in=dashboard_ids).exists()
+        assert not DashboardWidget.objects.filter(id__in=widget_ids).exists()
+        assert not DashboardWidgetQuery.objects.filter(id__in=query_ids).exists()
+        assert Dashboard.objects.filter(id=other_dashboard.id).exists()
+
+        assert sorted(pre_deleted) == sorted(dashboard_ids)
+        assert sorted(post_deleted) == sorted(
+            [("DashboardWidget", i) for i in widget_ids]
+            + [("DashboardWidgetQuery", i) for i in query_ids]
+        )
@@ -111,3 +111,19 @@ class DeleteGroupTest(TestCase, SnubaTestCase):
             delete_groups(object_ids=[group.id])
 
         assert nodestore_delete_multi.call_count == 0
+
+    @mock.patch.object(EventDataDeletionTask, "DEFAULT_CHUNK_SIZE", 1)
+    @mock.patch("sentry.nodestore.delete")
+    @mock.patch("sentry.nodestore.delete_multi")
+    def test_batches_nodestore_deletes(self, nodestore_delete_multi, nodestore_delete):
+        group = self.event.group
+
+        with self.tasks():
+            delete_groups(object_ids=[group.id])
+
+        # One delete_multi call per page of events, never per-node deletes.
+        assert nodestore_delete.call_count == 0
+        assert nodestore_delete_multi.call_count == 2
+        node_ids = [call_args[0][0] for call_args in nodestore_delete_multi.call_args_list]
+        assert all(len(page) == 1 for page in node_ids)
+        assert {page[0] for page in node_ids} == {self.node_id, self.node_id2}
@@ -1,5 +1,7 @@
 from uuid import uuid4
 
+from django.db.models.signals import post_save
+
 from sentry.discover.models import DiscoverSavedQuery, DiscoverSavedQueryProject
 from sentry.incidents.models import AlertRule, AlertRuleStatus
 from sentry.models import (
@@ -26,14 +28,17 @@ from sentry.models import (
 from sentry.snuba.models import SnubaQuery
 from sentry.tasks.deletion import run_deletion
 from sentry.testutils import TransactionTestCase
+from sentry.testutils.asserts import assert_rows_deleted
+from sentry.testutils.helpers import mute_signals
 
 
 class DeleteOrganizationTest(TransactionTestCase):
     def test_simple(self):
         org = self.create_organization(name="test")
         org2 = self.create_organization(name="test2")
-        self.create_team(organization=org, name="test1")
-        self.create_team(organization=org, name="test2")
+        with mute_signals(post_save):
+            self.create_team(organization=org, name="test1")
+            self.create_team(organization=org, name="test2")
         release = Release.objects.create(version="a" * 32, organization_id=org.id)
         repo = Repository.objects.create(organization_id=org.id, name=org.name, provider="dummy")
         commit_author = CommitAuthor.objects.create(
@@ -45,7 +50,7 @@ class DeleteOrganizationTest(TransactionTestCase):
         pull_request = PullRequest.objects.create(
             repository_id=repo.id, organization_id=org.id, author=commit_author, key="b" * 40
         )
-        ReleaseCommit.objects.create(
+        release_commit = ReleaseCommit.objects.create(
             organization_id=org.id, release=release, commit=commit, order=0
         )
 
@@ -94,21 +99,23 @@ class DeleteOrganizationTest(TransactionTestCase):
 
         assert Organization.objects.filter(id=org2.id).exists()
 
-        assert not Organization.objects.filter(id=org.id).exists()
-        assert not Environment.objects.filter(id=env.id).exists()
-        assert not ReleaseEnvironment.objects.filter(id=release_env.id).exists()
-        assert not Repository.objects.filter(id=repo.id).exists()
-        assert not ReleaseCommit.objects.filter(organization_id=org.id).exists()
-        assert not Release.objects.filter(organization_id=org.id).exists()
-        assert not CommitAuthor.objects.filter(id=commit_author.id).exists()
-        assert not Commit.objects.filter(id=commit.id).exists()
-        assert not PullRequest.objects.filter(id=pull_request.id).exists()
-        assert not ExternalIssue.objects.filter(id=external_issue.id).exists()
-        assert not Dashboard.objects.filter(id=dashboard.id).exists()
-        assert not DashboardWidget.objects.filter(id__in=[widget_1.id, widget_2.id]).exists()
-        assert not DashboardWidgetQuery.objects.filter(
-            id__in=[widget_1_data.id, widget_2_data_1.id, widget_2_data_2.id]
-        ).exists()
+        assert_rows_deleted(
+            {
+                Organization: [org.id],
+                Environment: [env.id],
+                ReleaseEnvironment: [release_env.id],
+                Repository: [repo.id],
+                ReleaseCommit: [release_commit.id],
+                Release: [release.id],
+                CommitAuthor: [commit_author.id],
+                Commit: [commit.id],
+                PullRequest: [pull_request.id],
+                ExternalIssue: [external_issue.id],
+                Dashboard: [dashboard.id],
+                DashboardWidget: [widget_1.id, widget_2.id],
+                DashboardWidgetQuery: [widget_1_data.id, widget_2_data_1.id, widget_2_data_2.id],
+            }
+        )
 
     def test_no_delete_visible(self):
         org = self.create_organization(name="test")
@@ -136,11 +143,17 @@ class DeleteOrganizationTest(TransactionTestCase):
             organization_id=org.id, name="sally", email="sally@example.com"
         )
         # Make >100 commits so we can ensure that all commits are removed before authors are.
-        for i in range(0, 150):
-            author = author_bob if i % 2 == 0 else author_sally
-            Commit.objects.create(
-                repository_id=repo.id, organization_id=org.id, author=author, key=uuid4().hex
-            )
+        Commit.objects.bulk_create(
+            [
+                Commit(
+                    repository_id=repo.id,
+                    organization_id=org.id,
+                    author=author_bob if i % 2 == 0 else author_sally,
+                    key=uuid4().hex,
+                )
+                for i in range(0, 150)
+            ]
+        )
 
         org.update(status=OrganizationStatus.PENDING_DELETION)
         deletion = ScheduledDeletion.schedule(org, days=0)
@@ -19,6 +19,7 @@ from sentry.models import (
 )
 from sentry.tasks.deletion import run_deletion
 from sentry.testutils import TransactionTestCase
+from sentry.testutils.asserts import assert_rows_deleted
 
 
 class DeleteProjectTest(TransactionTestCase):
@@ -62,7 +63,7 @@ class DeleteProjectTest(TransactionTestCase):
             project_id=project.id,
         )
         file_attachment = File.objects.create(name="hello.png", type="image/png")
-        EventAttachment.objects.create(
+        attachment = EventAttachment.objects.create(
             event_id=event.event_id,
             project_id=event.project_id,
             file_id=file_attachment.id,
@@ -82,16 +83,20 @@ class DeleteProjectTest(TransactionTestCase):
         with self.tasks():
             run_deletion(deletion.id)
 
-        assert not Project.objects.filter(id=project.id).exists()
+        assert_rows_deleted(
+            {
+                Project: [project.id],
+                Group: [group.id],
+                EventAttachment: [attachment.id],
+                ProjectDebugFile: [dif.id],
+                File: [file.id],
+                ServiceHook: [hook.id],
+            }
+        )
         assert not EnvironmentProject.objects.filter(
             project_id=project.id, environment_id=env.id
         ).exists()
         assert Environment.objects.filter(id=env.id).exists()
-        assert not Group.objects.filter(project_id=project.id).exists()
-        assert not EventAttachment.objects.filter(project_id=project.id).exists()
         assert Release.objects.filter(id=release.id).exists()
         assert ReleaseCommit.objects.filter(release_id=release.id).exists()
         assert Commit.objects.filter(id=commit.id).exists()
-        assert not ProjectDebugFile.objects.filter(id=dif.id).exists()
-        assert not File.objects.filter(id=file.id).exists()
-        assert not ServiceHook.objects.filter(id=hook.id).exists()
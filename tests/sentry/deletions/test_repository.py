@@ -6,9 +6,11 @@ from sentry.constants import ObjectStatus
 from sentry.exceptions import PluginError
 from sentry.models import (
     Commit,
+    CommitFileChange,
     Integration,
     OrganizationOption,
     ProjectCodeOwners,
+    ReleaseCommit,
     Repository,
     RepositoryProjectPathConfig,
     ScheduledDeletion,
@@ -46,6 +48,39 @@ class DeleteRepositoryTest(TransactionTestCase):
         assert not Commit.objects.filter(id=commit.id).exists()
         assert Commit.objects.filter(id=commit2.id).exists()
 
+    def test_commit_children(self):
+        org = self.create_organization()
+        repo = Repository.objects.create(
+            organization_id=org.id,
+            provider="dummy",
+            name="example/example",
+            status=ObjectStatus.PENDING_DELETION,
+        )
+        release = self.create_release(project=self.create_project(organization=org))
+        commits = [
+            Commit.objects.create(repository_id=repo.id, organization_id=org.id, key=key)
+            for key in ("1234abcd", "5678efgh")
+        ]
+        for order, commit in enumerate(commits):
+            CommitFileChange.objects.create(
+                organization_id=org.id, commit=commit, filename="foo.py", type="M"
+            )
+            ReleaseCommit.objects.create(
+                organization_id=org.id, release=release, commit=commit, order=order
+            )
+
+        deletion = ScheduledDeletion.schedule(repo, days=0)
+        deletion.update(in_progress=True)
+
+        with self.tasks():
+            run_deletion(deletion.id)
+
+        commit_ids = [commit.id for commit in commits]
+        assert not Repository.objects.filter(id=repo.id).exists()
+        assert not Commit.objects.filter(id__in=commit_ids).exists()
+        assert not CommitFileChange.objects.filter(commit_id__in=commit_ids).exists()
+        assert not ReleaseCommit.objects.filter(commit_id__in=commit_ids).exists()
+
     def test_codeowners(self):
         org = self.create_organization(owner=self.user)
         self.integration = Integration.objects.create(
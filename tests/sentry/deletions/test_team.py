@@ -1,3 +1,4 @@
+from sentry.incidents.models import AlertRule
 from sentry.models import Project, ProjectTeam, Rule, ScheduledDeletion, Team
 from sentry.tasks.deletion import run_deletion
 from sentry.testutils import TestCase
@@ -38,7 +39,9 @@ class DeleteTeamTest(TestCase):
         assert not Team.objects.filter(id=team.id).exists()
         assert Project.objects.filter(id=project.id).exists()
 
-        alert_rule.refresh_from_db()
-        rule.refresh_from_db()
-        assert rule.owner_id is None, "Should be blank when team is deleted."
-        assert alert_rule.owner_id is None, "Should be blank when team is deleted."
+        rule_owner_id = Rule.objects.values_list("owner_id", flat=True).get(id=rule.id)
+        alert_rule_owner_id = AlertRule.objects.values_list("owner_id", flat=True).get(
+            id=alert_rule.id
+        )
+        assert rule_owner_id is None, "Should be blank when team is deleted."
+        assert alert_rule_owner_id is None, "Should be blank when team is deleted."
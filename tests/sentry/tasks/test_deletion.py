@@ -1,6 +1,5 @@
 from datetime import timedelta
-from unittest.mock import Mock
-from uuid import uuid4
+from unittest.mock import patch
 
 from sentry import nodestore
 from sentry.constants import ObjectStatus
@@ -19,13 +18,30 @@ from sentry.models import (
 from sentry.signals import pending_delete
 from sentry.tasks.deletion import delete_groups, reattempt_deletions, run_scheduled_deletions
 from sentry.testutils import TestCase
+from sentry.testutils.asserts import assert_rows_deleted
+from sentry.testutils.factories import Factories
 from sentry.testutils.helpers.datetime import before_now, iso_format
 
 
+class _CallLogger:
+    """
+    A signal receiver that only records the keyword arguments of each call.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+
+
 class RunScheduledDeletionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Factories.create_organization(name="test")
+
     def test_schedule_and_cancel(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
 
         schedule = ScheduledDeletion.schedule(team, days=0)
         ScheduledDeletion.cancel(team)
@@ -35,8 +51,7 @@ class RunScheduledDeletionTest(TestCase):
         assert ScheduledDeletion.cancel(team) is None
 
     def test_duplicate_schedule(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
 
         first = ScheduledDeletion.schedule(team, days=0)
         second = ScheduledDeletion.schedule(team, days=1)
@@ -47,8 +62,7 @@ class RunScheduledDeletionTest(TestCase):
         assert second.date_scheduled - first.date_scheduled >= timedelta(days=1)
 
     def test_simple(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
         schedule = ScheduledDeletion.schedule(instance=team, days=0)
 
         with self.tasks():
@@ -57,9 +71,20 @@ class RunScheduledDeletionTest(TestCase):
         assert not Team.objects.filter(id=team.id).exists()
         assert not ScheduledDeletion.objects.filter(id=schedule.id).exists()
 
+    @patch("sentry.tasks.deletion.SCHEDULED_DELETION_BATCH_SIZE", 1)
+    def test_multiple_batches(self):
+        teams = [self.create_team(organization=self.org, name=f"delete{i}") for i in range(3)]
+        for team in teams:
+            ScheduledDeletion.schedule(instance=team, days=0)
+
+        with self.tasks():
+            run_scheduled_deletions()
+
+        assert not Team.objects.filter(id__in=[team.id for team in teams]).exists()
+        assert not ScheduledDeletion.objects.exists()
+
     def test_should_proceed_check(self):
-        org = self.create_organization(name="test")
-        project = self.create_project(organization=org)
+        project = self.create_project(organization=self.org)
         repo = self.create_repo(project=project, name="example/example")
         assert repo.status == ObjectStatus.ACTIVE
 
@@ -72,10 +97,8 @@ class RunScheduledDeletionTest(TestCase):
         assert not ScheduledDeletion.objects.filter(id=schedule.id, in_progress=True).exists()
 
     def test_ignore_in_progress(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
-        schedule = ScheduledDeletion.schedule(instance=team, days=0)
-        schedule.update(in_progress=True)
+        team = self.create_team(organization=self.org, name="delete")
+        schedule = ScheduledDeletion.schedule(instance=team, days=0, in_progress=True)
 
         with self.tasks():
             run_scheduled_deletions()
@@ -84,8 +107,7 @@ class RunScheduledDeletionTest(TestCase):
         assert ScheduledDeletion.objects.filter(id=schedule.id, in_progress=True).exists()
 
     def test_future_schedule(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
         schedule = ScheduledDeletion.schedule(instance=team, days=1)
 
         with self.tasks():
@@ -95,28 +117,26 @@ class RunScheduledDeletionTest(TestCase):
         assert ScheduledDeletion.objects.filter(id=schedule.id, in_progress=False).exists()
 
     def test_triggers_pending_delete_signal(self):
-        signal_handler = Mock()
+        signal_handler = _CallLogger()
         pending_delete.connect(signal_handler)
 
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
         ScheduledDeletion.schedule(instance=team, actor=self.user, days=0)
 
         with self.tasks():
             run_scheduled_deletions()
 
-        assert signal_handler.call_count == 1
-        args = signal_handler.call_args_list[0][1]
+        assert len(signal_handler.calls) == 1
+        args = signal_handler.calls[0]
         assert args["instance"] == team
         assert args["actor"] == self.user
         pending_delete.disconnect(signal_handler)
 
     def test_no_pending_delete_trigger_on_skipped_delete(self):
-        org = self.create_organization(name="test")
-        project = self.create_project(organization=org)
+        project = self.create_project(organization=self.org)
         repo = self.create_repo(project=project, name="example/example")
 
-        signal_handler = Mock()
+        signal_handler = _CallLogger()
         pending_delete.connect(signal_handler)
 
         ScheduledDeletion.schedule(instance=repo, actor=self.user, days=0)
@@ -125,11 +145,10 @@ class RunScheduledDeletionTest(TestCase):
             run_scheduled_deletions()
 
         pending_delete.disconnect(signal_handler)
-        assert signal_handler.call_count == 0
+        assert len(signal_handler.calls) == 0
 
     def test_handle_missing_record(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
+        team = self.create_team(organization=self.org, name="delete")
         schedule = ScheduledDeletion.schedule(instance=team, days=0)
         # Delete the team, the deletion should remove itself, as its work is done.
         team.delete()
@@ -141,11 +160,13 @@ class RunScheduledDeletionTest(TestCase):
 
 
 class ReattemptDeletionsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Factories.create_organization(name="test")
+
     def test_simple(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
-        schedule = ScheduledDeletion.schedule(instance=team, days=-3)
-        schedule.update(in_progress=True)
+        team = self.create_team(organization=self.org, name="delete")
+        schedule = ScheduledDeletion.schedule(instance=team, days=-3, in_progress=True)
         with self.tasks():
             reattempt_deletions()
 
@@ -153,10 +174,8 @@ class ReattemptDeletionsTest(TestCase):
         assert not schedule.in_progress
 
     def test_ignore_recent_jobs(self):
-        org = self.create_organization(name="test")
-        team = self.create_team(organization=org, name="delete")
-        schedule = ScheduledDeletion.schedule(instance=team, days=0)
-        schedule.update(in_progress=True)
+        team = self.create_team(organization=self.org, name="delete")
+        schedule = ScheduledDeletion.schedule(instance=team, days=0, in_progress=True)
         with self.tasks():
             reattempt_deletions()
 
@@ -169,44 +188,41 @@ class DeleteGroupTest(TestCase):
         event_id = "a" * 32
         event_id_2 = "b" * 32
         project = self.create_project()
+        group = self.create_group(project=project, status=GroupStatus.PENDING_DELETION)
 
         node_id = Event.generate_node_id(project.id, event_id)
         node_id_2 = Event.generate_node_id(project.id, event_id_2)
 
-        event = self.store_event(
-            data={
-                "event_id": event_id,
-                "timestamp": iso_format(before_now(minutes=1)),
-                "fingerprint": ["group1"],
-            },
-            project_id=project.id,
-        )
-
-        self.store_event(
-            data={
-                "event_id": event_id_2,
-                "timestamp": iso_format(before_now(minutes=1)),
-                "fingerprint": ["group1"],
-            },
-            project_id=project.id,
-        )
-
-        group = event.group
-        group.update(status=GroupStatus.PENDING_DELETION)
+        # Write the event payloads directly rather than going through ingestion,
+        # the deletion only needs to find the events and their nodestore entries.
+        nodestore.set(node_id, {"event_id": event_id})
+        nodestore.set(node_id_2, {"event_id": event_id_2})
+        timestamp = iso_format(before_now(minutes=1))
+        events = [
+            Event(
+                project_id=project.id,
+                event_id=eid,
+                group_id=group.id,
+                snuba_data={"event_id": eid, "timestamp": timestamp},
+            )
+            for eid in (event_id, event_id_2)
+        ]
 
         GroupAssignee.objects.create(group=group, project=project, user=self.user)
-        GroupHash.objects.create(project=project, group=group, hash=uuid4().hex)
+        group_hash = GroupHash.objects.create(project=project, group=group, hash="c" * 32)
         GroupMeta.objects.create(group=group, key="foo", value="bar")
-        GroupRedirect.objects.create(group_id=group.id, previous_group_id=1)
+        redirect = GroupRedirect.objects.create(group_id=group.id, previous_group_id=1)
 
         assert nodestore.get(node_id)
         assert nodestore.get(node_id_2)
 
-        with self.tasks():
+        with self.tasks(), patch(
+            "sentry.eventstore.get_unfetched_events", side_effect=[events, []]
+        ):
             delete_groups(object_ids=[group.id])
 
-        assert not GroupRedirect.objects.filter(group_id=group.id).exists()
-        assert not GroupHash.objects.filter(group_id=group.id).exists()
-        assert not Group.objects.filter(id=group.id).exists()
+        assert_rows_deleted(
+            {GroupRedirect: [redirect.id], GroupHash: [group_hash.id], Group: [group.id]}
+        )
         assert not nodestore.get(node_id)
         assert not nodestore.get(node_id_2)
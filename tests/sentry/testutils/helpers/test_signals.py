@@ -0,0 +1,20 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from django.dispatch import Signal
+
+from sentry.testutils.helpers import mute_signals
+
+
+class TestTestUtilsSignalsHelper(TestCase):
+    def test_mute_signals(self):
+        signal = Signal()
+        receiver = Mock()
+        signal.connect(receiver, weak=False)
+
+        with mute_signals(signal):
+            signal.send(sender=None)
+        assert receiver.call_count == 0
+
+        signal.send(sender=None)
+        assert receiver.call_count == 1
@@ -1,6 +1,12 @@
-from sentry.models import User
-from sentry.testutils import TestCase
-from sentry.utils.query import RangeQuerySetWrapper
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from sentry.models import User, UserReport
+from sentry.testutils import TestCase, TransactionTestCase
+from sentry.utils.query import RangeQuerySetWrapper, bulk_delete_objects
 
 
 class RangeQuerySetWrapperTest(TestCase):
@@ -26,3 +32,82 @@ class RangeQuerySetWrapperTest(TestCase):
             user.delete()
 
         assert User.objects.all().count() == 0
+
+
+class BulkDeleteObjectsTest(TestCase):
+    def test_basic(self):
+        for i in range(3):
+            UserReport.objects.create(
+                project_id=self.project.id, event_id=uuid4().hex, name=f"report {i}"
+            )
+        other = UserReport.objects.create(
+            project_id=self.create_project().id, event_id=uuid4().hex, name="other"
+        )
+
+        assert bulk_delete_objects(UserReport, project_id=self.project.id)
+        assert not UserReport.objects.filter(project_id=self.project.id).exists()
+        assert UserReport.objects.filter(id=other.id).exists()
+
+        assert not bulk_delete_objects(UserReport, project_id=self.project.id)
+
+    def test_limit(self):
+        for i in range(3):
+            UserReport.objects.create(
+                project_id=self.project.id, event_id=uuid4().hex, name=f"report {i}"
+            )
+
+        assert bulk_delete_objects(UserReport, limit=2, project_id=self.project.id)
+        assert UserReport.objects.filter(project_id=self.project.id).count() == 1
+
+    def test_list_filter(self):
+        reports = [
+            UserReport.objects.create(
+                project_id=self.project.id, event_id=uuid4().hex, name=f"report {i}"
+            )
+            for i in range(3)
+        ]
+
+        assert bulk_delete_objects(UserReport, id=[reports[0].id, reports[1].id])
+        assert list(UserReport.objects.values_list("id", flat=True)) == [reports[2].id]
+
+
+@patch("sentry.utils.query.ASYNC_COMMIT_DELETE_THRESHOLD", 1)
+class BulkDeleteObjectsCommitModeTest(TransactionTestCase):
+    ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit TO OFF"
+
+    def create_reports(self, count):
+        for i in range(count):
+            UserReport.objects.create(
+                project_id=self.project.id, event_id=uuid4().hex, name=f"report {i}"
+            )
+
+    def executed_sql(self, queries):
+        return [query["sql"] for query in queries.captured_queries]
+
+    def test_async_commit(self):
+        self.create_reports(2)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert bulk_delete_objects(UserReport, project_id=self.project.id)
+
+        assert self.ASYNC_COMMIT_SQL in self.executed_sql(queries)
+        assert not UserReport.objects.filter(project_id=self.project.id).exists()
+
+    def test_below_threshold(self):
+        self.create_reports(1)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert bulk_delete_objects(UserReport, project_id=self.project.id)
+
+        assert self.ASYNC_COMMIT_SQL not in self.executed_sql(queries)
+
+    def test_outer_transaction(self):
+        self.create_reports(2)
+
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            assert bulk_delete_objects(UserReport, project_id=self.project.id)
+
+        executed_sql = self.executed_sql(queries)
+        assert self.ASYNC_COMMIT_SQL not in executed_sql
+        assert not [sql for sql in executed_sql if sql.startswith("SAVEPOINT")]
+        assert not UserReport.objects.filter(project_id=self.project.id).exists()